@@ -0,0 +1,20 @@
+"""
+Builds the optional compiled helpers for the virtual-key controller.
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The resulting extension lands next to its .pyx under src/; without it the
+controller runs on the pure NumPy code paths.
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="virtual-key-ext",
+    package_dir={"": "src"},
+    ext_modules=cythonize(
+        [Extension("core._spatial_c", ["src/core/_spatial_c.pyx"])],
+    ),
+)
@@ -19,6 +19,9 @@ engine.calibrate(
 
 # For every landmark:
 px, py = engine.project_point(landmark.x, landmark.y)   # both in [0,1]
+
+# Or for a whole frame's worth of points at once:
+proj = engine.project_points_batch(np.array([[x, y], ...]))  # (N,2) in [0,1]
 """
 
 from __future__ import annotations
@@ -28,10 +31,22 @@ from typing import List, Optional, Tuple
 import cv2
 import numpy as np
 
+try:
+    from ._spatial_c import project_batch as _project_batch_c
+except ImportError:  # extension not built (see setup.py); use NumPy
+    _project_batch_c = None
+
 
 class SpatialEngine:
     def __init__(self) -> None:
         self.homography_matrix: Optional[np.ndarray] = None
+        # Row-major homography coefficients h0..h8 as plain floats, so the
+        # per-point projection stays in scalar Python (no ndarray / cv2 call).
+        self._h: Optional[List[float]] = None
+        # Transposed float32 homography for row-vector batch projection.
+        self._h_t: Optional[np.ndarray] = None
+        # Contiguous float64 copy of h0..h8 for the compiled batch kernel.
+        self._h_arr: Optional[np.ndarray] = None
 
     # ------------------------------------------------------------------
     # Calibration
@@ -66,10 +81,16 @@ class SpatialEngine:
             dtype="float32",
         )
         self.homography_matrix, _ = cv2.findHomography(src_norm, dst_norm)
+        self._h = self.homography_matrix.ravel().tolist()
+        self._h_t = self.homography_matrix.T.astype(np.float32)
+        self._h_arr = np.ascontiguousarray(self.homography_matrix.ravel(), dtype=np.float64)
 
     def reset(self) -> None:
         """Clear calibration (identity pass-through)."""
         self.homography_matrix = None
+        self._h = None
+        self._h_t = None
+        self._h_arr = None
 
     # ------------------------------------------------------------------
     # Projection
@@ -84,15 +105,53 @@ class SpatialEngine:
         Returns:
             (px, py) both clamped to [0, 1].
         """
-        if self.homography_matrix is None:
+        h = self._h   # single read: calibrate()/reset() may run on another thread
+        if h is None:
             return float(x), float(y)
 
-        point = np.array([[[x, y]]], dtype="float32")
-        transformed = cv2.perspectiveTransform(point, self.homography_matrix)
-        px = float(transformed[0][0][0])
-        py = float(transformed[0][0][1])
+        h0, h1, h2, h3, h4, h5, h6, h7, h8 = h
+        w  = h6 * x + h7 * y + h8
+        px = (h0 * x + h1 * y + h2) / w
+        py = (h3 * x + h4 * y + h5) / w
 
         # Clamp output to valid range (rounding errors near edges)
         px = max(0.0, min(1.0, px))
         py = max(0.0, min(1.0, py))
         return px, py
+
+    def project_points_batch(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Project an (N, 2) array of normalised coordinates in one go.
+
+        Uses the compiled _spatial_c kernel when it has been built, else
+        applies the homography as a single (N,3)·(3,3) matmul plus divide.
+        Either way the per-call overhead of project_point() is paid once
+        per frame rather than once per fingertip.
+
+        If not yet calibrated the input itself is returned, without a copy.
+
+        Returns:
+            (N, 2) array, clamped to [0, 1] when calibrated.
+        """
+        if _project_batch_c is not None:
+            h_arr = self._h_arr
+            if h_arr is None:
+                return pts
+            pts = np.ascontiguousarray(pts, dtype=np.float32)
+            out = np.empty_like(pts)
+            _project_batch_c(pts, h_arr, out)
+            return out
+
+        h_t = self._h_t
+        if h_t is None:
+            return pts
+
+        n   = len(pts)
+        xyw = np.empty((n, 3), dtype=np.float32)
+        xyw[:, :2] = pts
+        xyw[:, 2]  = 1.0
+        proj = xyw @ h_t
+        out  = proj[:, :2]
+        out /= proj[:, 2:3]
+        np.clip(out, 0.0, 1.0, out=out)
+        return out
@@ -15,7 +15,10 @@ from __future__ import annotations
 import json
 import os
 import sys
+import threading
 import time
+from collections import OrderedDict
+from queue import Empty, Full, Queue
 from typing import Dict, List, Set, Tuple
 
 import cv2
@@ -29,13 +32,23 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from core.spatial import SpatialEngine   # noqa: E402
 from midi.mpe_engine import MPEEngine    # noqa: E402
-from utils.filters import OneEuroFilter  # noqa: E402
+from utils.filters import one_euro_batch  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # MediaPipe landmark indices
 # ---------------------------------------------------------------------------
 FINGER_TIPS: Dict[str, int] = {"index": 8, "middle": 12, "ring": 16, "pinky": 20}
 FINGER_MCP:  Dict[str, int] = {"index": 5, "middle":  9, "ring": 13, "pinky": 17}
+TIP_IDS:     Tuple[int, ...] = tuple(FINGER_TIPS.values())
+TIP_ROWS:    np.ndarray      = np.array(TIP_IDS)   # for indexing (21, 3) landmark arrays
+NUM_LANDMARKS: int = 21
+
+MAX_HANDS: int = 2
+# Fingertip slot = hand_idx * len(TIP_IDS) + finger order.  Slots index all
+# per-finger state and double as MPE finger ids; hands present in a frame
+# always occupy a contiguous prefix of the slots.
+NUM_SLOTS: int = MAX_HANDS * len(TIP_IDS)
+NO_NOTE:   int = -1
 
 # Hand skeleton connections for OpenCV drawing
 HAND_CONNECTIONS: List[Tuple[int, int]] = [
@@ -46,6 +59,7 @@ HAND_CONNECTIONS: List[Tuple[int, int]] = [
     (13, 17), (17, 18), (18, 19), (19, 20),
     (0, 17),
 ]
+HAND_SEGMENTS: np.ndarray = np.array(HAND_CONNECTIONS)   # (21, 2) index pairs
 
 BLACK_KEY_CLASSES: Set[int] = {1, 3, 6, 8, 10}
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
@@ -55,6 +69,9 @@ NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 KEY_ZONE_TOP:     float = 0.76   # fingertip enters zone  → note on
 KEY_ZONE_RELEASE: float = 0.73   # fingertip leaves zone  → note off (3% hysteresis)
 
+HUD_HEIGHT:    int = 48   # status bar covers rows 0..HUD_HEIGHT inclusive
+HUD_CACHE_MAX: int = 32
+
 
 # ===========================================================================
 class OpticalController:
@@ -74,11 +91,23 @@ class OpticalController:
         self.press_z_thresh:   float = self.config["keyboard"]["press_z_threshold"]
         self.release_z_thresh: float = self.config["keyboard"]["release_z_threshold"]
 
+        # Max width of the image handed to MediaPipe.  Frames wider than this
+        # are downscaled before colour conversion.  The landmark model crops
+        # each hand from this image, so lowering it trades fingertip (and
+        # hence key) precision for speed.
+        self.detect_width:     int   = self.config["system"]["detect_width"]
+
         # ── core engines ────────────────────────────────────────────────────
         self.spatial = SpatialEngine()
         self.mpe     = MPEEngine()
 
-        # ── MediaPipe HandLandmarker (Tasks API, VIDEO mode) ─────────────────
+        # ── MediaPipe HandLandmarker (Tasks API, LIVE_STREAM mode) ───────────
+        # Inference runs asynchronously; _on_result() keeps only the newest
+        # result so the main loop never waits on the model.
+        self._result_lock = threading.Lock()
+        self._latest_result: Tuple[List[np.ndarray], int] | None = None   # (hands, ts_ms)
+        self._last_ts_ms: int = -1
+
         base_dir   = os.path.dirname(os.path.dirname(__file__))
         model_path = os.path.join(base_dir, "models", "hand_landmarker.task")
         if not os.path.exists(model_path):
@@ -91,94 +120,186 @@ class OpticalController:
             )
         options = mp_vision.HandLandmarkerOptions(
             base_options=mp_tasks.BaseOptions(model_asset_path=model_path),
-            running_mode=mp_vision.RunningMode.VIDEO,
-            num_hands=2,
+            running_mode=mp_vision.RunningMode.LIVE_STREAM,
+            num_hands=MAX_HANDS,
             min_hand_detection_confidence=0.7,
             min_hand_presence_confidence=0.5,
             min_tracking_confidence=0.5,
+            result_callback=self._on_result,
         )
         self.detector = mp_vision.HandLandmarker.create_from_options(options)
         self._t0_ms   = int(time.time() * 1000)
+        self._small_buf: np.ndarray | None = None   # downscaled BGR frame
+        self._rgb_buf:   np.ndarray | None = None   # reused BGR→RGB target
 
-        # ── One-Euro filters (x and y per finger per hand) ───────────────────
-        beta = self.config["system"]["smoothing_beta"]
-        freq = float(self.config["system"]["target_fps"])
-        self.filters_x: Dict[Tuple, OneEuroFilter] = {}
-        self.filters_y: Dict[Tuple, OneEuroFilter] = {}
-        for hi in range(2):
-            for tip_id in FINGER_TIPS.values():
-                k = (hi, tip_id)
-                self.filters_x[k] = OneEuroFilter(freq=freq, min_cutoff=1.0, beta=beta)
-                self.filters_y[k] = OneEuroFilter(freq=freq, min_cutoff=1.0, beta=beta)
+        # ── One-Euro filter state (row 0 = x, row 1 = y; one column per slot) ─
+        self.filter_min_cutoff: float = 1.0
+        self.filter_beta:       float = self.config["system"]["smoothing_beta"]
+        self.filter_d_cutoff:   float = 1.0
+        self._f_x_prev  = np.zeros((2, NUM_SLOTS))
+        self._f_dx_prev = np.zeros((2, NUM_SLOTS))
+        self._f_t_prev  = np.full((2, NUM_SLOTS), -1.0)
 
         # ── state ────────────────────────────────────────────────────────────
-        self.active_fingers: Dict[Tuple, int] = {}
+        self.finger_notes:   List[int] = [NO_NOTE] * NUM_SLOTS   # note held per slot
+        self.hands: List[np.ndarray] = []   # (21, 3) landmarks per hand, last result
+        self.active_notes:   Set[int] = set()
         self.calibrating:        bool = False
         self.calibration_points: list = []
         self.frame_w: int = 640
         self.frame_h: int = 480
 
+        # ── keyboard overlay cache (rebuilt when the frame size changes) ─────
+        self._kb_sprite: np.ndarray | None = None   # all-keys-inactive strip
+        self._kb_mask:   np.ndarray | None = None   # 255 where a key is drawn
+        self._kb_strip:  np.ndarray | None = None   # per-frame scratch buffers
+        self._kb_blend:  np.ndarray | None = None
+        self._kb_size:   Tuple[int, int]   = (0, 0)
+        self._kb_y: int = 0
+        self._kb_h: int = 0
+
+        # ── pre-rendered HUD strips, LRU keyed on everything they display ────
+        self._hud_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+        # ── processing thread → display (main thread) hand-off ───────────────
+        self._disp_q:  Queue[np.ndarray] = Queue(maxsize=1)   # newest frame only
+        self._running = threading.Event()
+
+        # ── capture thread → processing hand-off (newest frame only) ─────────
+        self._cap_lock  = threading.Lock()
+        self._frame_evt = threading.Event()
+        self._latest_frame: np.ndarray | None = None
+
     # ==========================================================================
     # Helpers
     # ==========================================================================
 
-    def _note_from_x(self, x: float) -> int:
-        return self.note_start + int(max(0.0, min(0.9999, x)) * self.num_notes)
+    def _notes_from_x(self, xs: np.ndarray) -> List[int]:
+        """Map projected x positions (0-1) to MIDI notes, one vector op for all."""
+        bins = (xs * self.num_notes).astype(np.int32)
+        np.clip(bins, 0, self.num_notes - 1, out=bins)
+        return (bins + self.note_start).tolist()
 
     def _velocity_from_z_delta(self, z_delta: float) -> int:
         return int(min(127, max(1, (z_delta - self.press_z_thresh) * 1200 + 60)))
 
     def _ts(self) -> int:
-        """Milliseconds since controller start (required by detect_for_video)."""
-        return int(time.time() * 1000) - self._t0_ms
+        """
+        Milliseconds since controller start (required by detect_async).
+
+        Strictly increasing, as MediaPipe rejects repeated timestamps.
+        """
+        self._last_ts_ms = max(int(time.time() * 1000) - self._t0_ms, self._last_ts_ms + 1)
+        return self._last_ts_ms
+
+    def _on_result(self, result, image, timestamp_ms: int) -> None:
+        """
+        LIVE_STREAM callback (MediaPipe thread): keep only the newest result.
+
+        Landmarks are copied out of the pybind objects once, into one
+        (21, 3) float32 array (x, y, z) per hand, so nothing downstream
+        touches the per-landmark attributes.
+        """
+        hands = [
+            np.fromiter(
+                (v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+                dtype=np.float32, count=NUM_LANDMARKS * 3,
+            ).reshape(NUM_LANDMARKS, 3)
+            for landmarks in (result.hand_landmarks or [])
+        ]
+        with self._result_lock:
+            self._latest_result = (hands, timestamp_ms)
 
     # ==========================================================================
     # Drawing
     # ==========================================================================
 
-    def _draw_hand(self, frame: np.ndarray, landmarks: list) -> None:
-        h, w = frame.shape[:2]
-        for a, b in HAND_CONNECTIONS:
-            p1 = (int(landmarks[a].x * w), int(landmarks[a].y * h))
-            p2 = (int(landmarks[b].x * w), int(landmarks[b].y * h))
-            cv2.line(frame, p1, p2, (0, 140, 200), 2)
-        for lm in landmarks:
-            cv2.circle(frame, (int(lm.x * w), int(lm.y * h)), 4, (0, 210, 255), -1)
-
-    def _draw_keyboard(self, frame: np.ndarray, active_notes: Set[int]) -> None:
-        h, w   = frame.shape[:2]
+    def _draw_hand(self, frame: np.ndarray, w: int, h: int, landmarks: np.ndarray) -> None:
+        pts = (landmarks[:, :2] * (w, h)).astype(np.int32)
+        # All 21 bones as 2-point open polylines in a single call
+        cv2.polylines(frame, pts[HAND_SEGMENTS], False, (0, 140, 200), 2)
+        for x, y in pts.tolist():
+            cv2.circle(frame, (x, y), 4, (0, 210, 255), -1)
+
+    def _draw_key(self, strip: np.ndarray, i: int, w: int, kh: int, active: bool) -> None:
+        """Paint key *i* into a keyboard strip whose top row is the key top."""
+        x0   = int(w * i       / self.num_notes)
+        x1   = int(w * (i + 1) / self.num_notes)
+        note = self.note_start + i
+        if (note % 12) in BLACK_KEY_CLASSES:
+            color = (0, 230, 80) if active else (35, 35, 35)
+            cv2.rectangle(strip, (x0, 0), (x1 - 1, int(kh * 0.62)), color, -1)
+            cv2.rectangle(strip, (x0, 0), (x1 - 1, int(kh * 0.62)), (70, 70, 70), 1)
+        else:
+            color = (0, 255, 120) if active else (215, 215, 215)
+            cv2.rectangle(strip, (x0, 0), (x1 - 1, kh), color, -1)
+            cv2.rectangle(strip, (x0, 0), (x1 - 1, kh), (70, 70, 70), 1)
+            xm   = int(w * (i + 0.5) / self.num_notes)
+            name = NOTE_NAMES[note % 12] + str(note // 12 - 1)
+            cv2.putText(strip, name, (xm - 9, kh - 5),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.28, (40, 40, 40), 1)
+
+    def _build_kb_sprite(self, w: int, h: int) -> None:
+        """Render the idle keyboard strip (and its coverage mask) once."""
         ky, kh = int(h * 0.76), int(h * 0.20)
-        overlay = frame.copy()
+        sprite = np.zeros((kh + 1, w, 3), dtype=np.uint8)
         for i in range(self.num_notes):
-            x0   = int(w * i       / self.num_notes)
-            x1   = int(w * (i + 1) / self.num_notes)
-            note = self.note_start + i
-            black  = (note % 12) in BLACK_KEY_CLASSES
-            active = note in active_notes
-            if black:
-                color = (0, 230, 80) if active else (35, 35, 35)
-                cv2.rectangle(overlay, (x0, ky), (x1 - 1, ky + int(kh * 0.62)), color, -1)
-                cv2.rectangle(overlay, (x0, ky), (x1 - 1, ky + int(kh * 0.62)), (70, 70, 70), 1)
-            else:
-                color = (0, 255, 120) if active else (215, 215, 215)
-                cv2.rectangle(overlay, (x0, ky), (x1 - 1, ky + kh), color, -1)
-                cv2.rectangle(overlay, (x0, ky), (x1 - 1, ky + kh), (70, 70, 70), 1)
-        cv2.addWeighted(overlay, 0.75, frame, 0.25, 0, frame)
+            self._draw_key(sprite, i, w, kh, active=False)
+
+        # Below the black keys the camera image shows through un-blended
+        mask = np.zeros((kh + 1, w), dtype=np.uint8)
+        mask[: int(kh * 0.62) + 1] = 255
         for i in range(self.num_notes):
-            note = self.note_start + i
-            if (note % 12) not in BLACK_KEY_CLASSES:
-                xm   = int(w * (i + 0.5) / self.num_notes)
-                name = NOTE_NAMES[note % 12] + str(note // 12 - 1)
-                cv2.putText(frame, name, (xm - 9, ky + kh - 5),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.28, (40, 40, 40), 1)
-
-    def _draw_hud(self, frame: np.ndarray, active_notes: Set[int]) -> None:
-        h, w = frame.shape[:2]
-        cv2.rectangle(frame, (0, 0), (w, 48), (18, 18, 18), -1)
-        cal  = "YES" if self.spatial.homography_matrix is not None else "NO"
-        text = (f"Notes:{len(active_notes)}  Cal:{cal}  Z:{self.press_z_thresh:.3f}"
+            if ((self.note_start + i) % 12) not in BLACK_KEY_CLASSES:
+                mask[:, int(w * i / self.num_notes):int(w * (i + 1) / self.num_notes)] = 255
+
+        self._kb_sprite, self._kb_mask = sprite, mask
+        self._kb_strip = np.empty_like(sprite)
+        self._kb_blend = np.empty_like(sprite)
+        self._kb_size = (w, h)
+        self._kb_y, self._kb_h = ky, kh
+
+    def _draw_keyboard(self, frame: np.ndarray, w: int, h: int, active_notes: Set[int]) -> None:
+        if self._kb_size != (w, h):
+            self._build_kb_sprite(w, h)
+        ky, kh = self._kb_y, self._kb_h
+
+        # Only touch the keyboard rows; the idle sprite is used as-is when
+        # nothing is pressed.
+        strip = self._kb_sprite
+        if active_notes:
+            strip = self._kb_strip
+            np.copyto(strip, self._kb_sprite)
+            for note in active_notes:
+                i = note - self.note_start
+                if 0 <= i < self.num_notes:
+                    self._draw_key(strip, i, w, kh, active=True)
+
+        roi = frame[ky:ky + kh + 1]
+        cv2.addWeighted(strip, 0.75, roi, 0.25, 0, dst=self._kb_blend)
+        cv2.copyTo(self._kb_blend, self._kb_mask, roi)
+
+    def _render_hud(self, w: int, num_notes: int, cal_on: bool, z: float) -> np.ndarray:
+        strip = np.empty((HUD_HEIGHT + 1, w, 3), dtype=np.uint8)
+        strip[:] = (18, 18, 18)
+        cal  = "YES" if cal_on else "NO"
+        text = (f"Notes:{num_notes}  Cal:{cal}  Z:{z:.3f}"
                 "  [Q]Quit [C]Cal [R]Reset [+/-]Z")
-        cv2.putText(frame, text, (8, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.48, (220, 220, 0), 1)
+        cv2.putText(strip, text, (8, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.48, (220, 220, 0), 1)
+        return strip
+
+    def _draw_hud(self, frame: np.ndarray, w: int, h: int, active_notes: Set[int]) -> None:
+        key  = (w, len(active_notes), self.spatial.homography_matrix is not None,
+                self.press_z_thresh)
+        strip = self._hud_cache.get(key)
+        if strip is None:
+            strip = self._hud_cache[key] = self._render_hud(w, *key[1:])
+            if len(self._hud_cache) > HUD_CACHE_MAX:
+                self._hud_cache.popitem(last=False)
+        else:
+            self._hud_cache.move_to_end(key)
+        frame[:HUD_HEIGHT + 1] = strip
+
         if self.calibrating:
             msg = f"  Click corner {len(self.calibration_points)+1}/4  (TL->TR->BR->BL)"
             cv2.putText(frame, msg, (4, h - 12), cv2.FONT_HERSHEY_SIMPLEX, 0.58, (0, 140, 255), 2)
@@ -190,39 +311,70 @@ class OpticalController:
     # MIDI logic
     # ==========================================================================
 
-    def _process_hand(self, landmarks: list, hand_idx: int, t: float) -> Set[int]:
-        """Process one hand's landmarks; return set of currently active notes."""
+    def _filter_tips(self, hands: List[np.ndarray], t: float) -> np.ndarray:
+        """Smooth every hand's fingertips; return (2, N) filtered x/y per slot."""
+        nt  = len(TIP_IDS)
+        n   = len(hands) * nt
+        raw = np.empty((2, n))
+        for hi, landmarks in enumerate(hands):
+            raw[:, hi * nt:(hi + 1) * nt] = landmarks[TIP_ROWS, :2].T
+        # Timestamp-driven: LIVE_STREAM drops stale results, so the interval
+        # between samples is not a fixed 1/fps.
+        for axis in range(2):
+            raw[axis] = one_euro_batch(
+                raw[axis], t,
+                self._f_x_prev[axis, :n], self._f_dx_prev[axis, :n], self._f_t_prev[axis, :n],
+                self.filter_min_cutoff, self.filter_beta, self.filter_d_cutoff,
+            )
+        return raw
+
+    def _process_result(self, hands: List[np.ndarray], t: float) -> Set[int]:
+        """Run the MIDI logic for one detection result; return active notes."""
+        all_active: Set[int] = set()
+
+        if hands:
+            # Filter, then project every fingertip of every hand in one call
+            filtered   = self._filter_tips(hands, t)
+            pts        = np.ascontiguousarray(filtered.T, dtype=np.float32)
+            proj       = self.spatial.project_points_batch(pts)
+            all_active = self._process_tips(filtered, proj)
+
+        # Release notes for any hand that has disappeared
+        for slot in range(len(hands) * len(TIP_IDS), NUM_SLOTS):
+            if self.finger_notes[slot] != NO_NOTE:
+                self.mpe.note_off(slot, self.finger_notes[slot])
+                self.finger_notes[slot] = NO_NOTE
+
+        return all_active
+
+    def _process_tips(self, filtered: np.ndarray, proj: np.ndarray) -> Set[int]:
+        """
+        Drive note on/off from filtered fingertips (2, N) and their projected
+        positions (N, 2), both indexed by slot; return active notes.
+        """
         active: Set[int] = set()
-        for name, tip_id in FINGER_TIPS.items():
-            k   = (hand_idx, tip_id)
-            tip = landmarks[tip_id]
-
-            fx = self.filters_x[k](tip.x, t)
-            fy = self.filters_y[k](tip.y, t)
-            px, py = self.spatial.project_point(fx, fy)
-
+        held  = self.finger_notes
+        notes = self._notes_from_x(proj[:, 0])
+        for slot, (fy, note) in enumerate(zip(filtered[1].tolist(), notes)):
             # Press = fingertip has entered the keyboard strip at the bottom
-            pressing   = fy >= KEY_ZONE_TOP
-            was_active = k in self.active_fingers
-
-            if pressing:
-                note = self._note_from_x(px)
+            if fy >= KEY_ZONE_TOP:
                 active.add(note)
 
-                if not was_active:
+                if held[slot] == NO_NOTE:
                     # new key press
-                    self.mpe.note_on(k, note, velocity=80)
-                    self.active_fingers[k] = note
-                elif self.active_fingers[k] != note:
+                    self.mpe.note_on(slot, note, velocity=80)
+                    held[slot] = note
+                elif held[slot] != note:
                     # finger moved to a different key
-                    self.mpe.note_off(k, self.active_fingers[k])
-                    self.mpe.note_on(k, note, velocity=80)
-                    self.active_fingers[k] = note
+                    self.mpe.note_off(slot, held[slot])
+                    self.mpe.note_on(slot, note, velocity=80)
+                    held[slot] = note
                 # (pitch-bend / expression disabled)
 
-            elif was_active and fy < KEY_ZONE_RELEASE:
+            elif held[slot] != NO_NOTE and fy < KEY_ZONE_RELEASE:
                 # fingertip left the zone (hysteresis prevents chattering)
-                self.mpe.note_off(k, self.active_fingers.pop(k))
+                self.mpe.note_off(slot, held[slot])
+                held[slot] = NO_NOTE
 
         return active
 
@@ -243,6 +395,104 @@ class OpticalController:
     # Main loop
     # ==========================================================================
 
+    def _on_key(self, key: int) -> bool:
+        """Handle a key press from the display window; return False to quit."""
+        if key == ord("q"):
+            return False
+        elif key == ord("c"):
+            self.calibrating        = True
+            self.calibration_points = []
+            print("[Calibration] Click 4 corners: TL -> TR -> BR -> BL")
+        elif key == ord("r"):
+            self.spatial.reset()
+            print("[Calibration] Reset.")
+        elif key in (ord("+"), ord("=")):
+            self.press_z_thresh   = round(min(0.15, self.press_z_thresh + 0.005), 3)
+            self.release_z_thresh = round(self.press_z_thresh * 0.5, 3)
+            print(f"[Z] press={self.press_z_thresh:.3f}  release={self.release_z_thresh:.3f}")
+        elif key == ord("-"):
+            self.press_z_thresh   = round(max(0.01, self.press_z_thresh - 0.005), 3)
+            self.release_z_thresh = round(self.press_z_thresh * 0.5, 3)
+            print(f"[Z] press={self.press_z_thresh:.3f}  release={self.release_z_thresh:.3f}")
+        return True
+
+    def _publish(self, frame: np.ndarray) -> None:
+        """Hand a finished frame to the display thread, dropping any stale one."""
+        try:
+            self._disp_q.put_nowait(frame)
+        except Full:
+            try:
+                self._disp_q.get_nowait()
+            except Empty:
+                pass   # display took it in the meantime
+            self._disp_q.put_nowait(frame)
+
+    def _capture_loop(self, cap: cv2.VideoCapture) -> None:
+        """Capture thread: keep only the newest camera frame in a 1-slot buffer."""
+        try:
+            while self._running.is_set() and cap.isOpened():
+                ret, frame = cap.read()
+                if not ret:
+                    print("[WARNING] Camera read failed. Exiting.")
+                    break
+                with self._cap_lock:
+                    self._latest_frame = frame
+                self._frame_evt.set()
+        finally:
+            self._running.clear()
+
+    def _process_loop(self) -> None:
+        """Worker thread: inference, MIDI and overlay drawing."""
+        last_raw = None
+        try:
+            while self._running.is_set():
+                self._frame_evt.wait(timeout=0.1)
+                self._frame_evt.clear()
+                with self._cap_lock:
+                    raw = self._latest_frame
+                if raw is None or raw is last_raw:
+                    continue   # no new frame since the last pass
+                last_raw = raw
+
+                frame = cv2.flip(raw, 1)   # mirror = natural interaction
+                # Frame size is read once per frame and passed to the helpers
+                h, w = frame.shape[:2]
+                self.frame_h, self.frame_w = h, w
+
+                # MediaPipe inference (async; result arrives via _on_result).
+                # Downscale first (if wider than detect_width), then convert;
+                # the full-res frame is only used for drawing.
+                dw = min(w, self.detect_width)
+                dh = round(dw * h / w)
+                if self._rgb_buf is None or self._rgb_buf.shape[:2] != (dh, dw):
+                    self._small_buf = np.empty((dh, dw, 3), dtype=np.uint8)
+                    self._rgb_buf   = np.empty_like(self._small_buf)
+                src = frame
+                if dw < w:
+                    src = cv2.resize(frame, (dw, dh), dst=self._small_buf,
+                                     interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb_buf)
+                self.detector.detect_async(mp_image, self._ts())
+
+                # Consume the most recent finished result, if any; older
+                # ones have already been overwritten (drop-frame policy).
+                with self._result_lock:
+                    latest, self._latest_result = self._latest_result, None
+                if latest is not None:
+                    self.hands, ts_ms = latest
+                    self.active_notes = self._process_result(
+                        self.hands, (self._t0_ms + ts_ms) / 1000.0
+                    )
+
+                for landmarks in self.hands:
+                    self._draw_hand(frame, w, h, landmarks)
+                self._draw_keyboard(frame, w, h, self.active_notes)
+                self._draw_hud(frame, w, h, self.active_notes)
+                self._publish(frame)
+        finally:
+            self._running.clear()
+
     def run(self) -> None:
         cam_idx = self.config["system"]["camera_index"]
         cap     = cv2.VideoCapture(cam_idx)
@@ -259,63 +509,44 @@ class OpticalController:
         print("Open your DAW and select it as a MIDI input.\n")
         print("Controls:  Q=Quit  C=Calibrate  R=Reset  +/-=Z-threshold\n")
 
-        try:
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    print("[WARNING] Camera read failed. Exiting.")
-                    break
-
-                frame = cv2.flip(frame, 1)   # mirror = natural interaction
-                self.frame_h, self.frame_w = frame.shape[:2]
-                t = time.time()
-
-                # MediaPipe inference
-                rgb      = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-                result   = self.detector.detect_for_video(mp_image, self._ts())
-
-                all_active: Set[int] = set()
-                num_hands = 0
-
-                if result.hand_landmarks:
-                    num_hands = len(result.hand_landmarks)
-                    for hi, landmarks in enumerate(result.hand_landmarks):
-                        self._draw_hand(frame, landmarks)
-                        all_active |= self._process_hand(landmarks, hi, t)
-
-                # Release notes for any hand that has disappeared
-                stale = [fk for fk in self.active_fingers if fk[0] >= num_hands]
-                for fk in stale:
-                    self.mpe.note_off(fk, self.active_fingers.pop(fk))
-
-                self._draw_keyboard(frame, all_active)
-                self._draw_hud(frame, all_active)
-                cv2.imshow(WIN, frame)
+        # Capture and processing run on their own threads; this (main) thread
+        # only shows frames and polls the keyboard, since HighGUI must stay on it.
+        self._running.set()
+        capture = threading.Thread(
+            target=self._capture_loop, args=(cap,), name="capture", daemon=True
+        )
+        processing = threading.Thread(
+            target=self._process_loop, name="processing", daemon=True
+        )
+        capture.start()
+        processing.start()
 
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord("q"):
+        try:
+            while self._running.is_set():
+                try:
+                    cv2.imshow(WIN, self._disp_q.get(timeout=0.1))
+                except Empty:
+                    pass
+                if not self._on_key(cv2.waitKey(1) & 0xFF):
                     break
-                elif key == ord("c"):
-                    self.calibrating        = True
-                    self.calibration_points = []
-                    print("[Calibration] Click 4 corners: TL -> TR -> BR -> BL")
-                elif key == ord("r"):
-                    self.spatial.reset()
-                    print("[Calibration] Reset.")
-                elif key in (ord("+"), ord("=")):
-                    self.press_z_thresh   = round(min(0.15, self.press_z_thresh + 0.005), 3)
-                    self.release_z_thresh = round(self.press_z_thresh * 0.5, 3)
-                    print(f"[Z] press={self.press_z_thresh:.3f}  release={self.release_z_thresh:.3f}")
-                elif key == ord("-"):
-                    self.press_z_thresh   = round(max(0.01, self.press_z_thresh - 0.005), 3)
-                    self.release_z_thresh = round(self.press_z_thresh * 0.5, 3)
-                    print(f"[Z] press={self.press_z_thresh:.3f}  release={self.release_z_thresh:.3f}")
         finally:
-            print("\nShutting down - sending MIDI panic ...")
-            self.mpe.all_notes_off()
-            self.detector.close()
-            cap.release()
+            self._running.clear()
+            # Bounded waits: a camera read stuck in the driver must not hang
+            # shutdown.  Anything a still-running thread is using is left
+            # alone rather than torn down underneath it.
+            processing.join(timeout=1.0)
+            capture.join(timeout=1.0)
+            if processing.is_alive():
+                print("\n[WARNING] Processing thread still running - skipping MIDI panic.")
+            else:
+                print("\nShutting down - sending MIDI panic ...")
+                self.mpe.all_notes_off()
+                self.mpe.close()
+                self.detector.close()
+            if capture.is_alive():
+                print("[WARNING] Camera read still blocked - not releasing capture.")
+            else:
+                cap.release()
             cv2.destroyAllWindows()
             print("Done.")
 
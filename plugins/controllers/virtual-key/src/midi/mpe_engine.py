@@ -18,7 +18,9 @@ This gives every simultaneous note its own independent:
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Tuple
 
 import rtmidi
 from rtmidi.midiconstants import CONTROL_CHANGE, NOTE_OFF, NOTE_ON, PITCH_BEND
@@ -34,6 +36,10 @@ class MPEEngine:
 
     Opens a virtual MIDI port named ``port_name``.  Connect to it from
     your DAW (Ableton Live → MIDI preferences, Logic → MIDI environment).
+
+    Messages are queued and written to the port by a dedicated sender
+    thread, so callers never block on MIDI I/O.  Call close() on shutdown
+    to flush the queue.
     """
 
     def __init__(self, port_name: str = "Optical MIDI Out") -> None:
@@ -52,6 +58,28 @@ class MPEEngine:
         # Free MPE note-channels: MIDI channels 2-16 → indices 1-15
         self.available_channels: List[int] = list(range(1, 16))
 
+        # Status bytes per channel index (status | channel, precomposed)
+        self._noteon_status  = bytes(NOTE_ON        | ch for ch in range(16))
+        self._noteoff_status = bytes(NOTE_OFF       | ch for ch in range(16))
+        self._pb_status      = bytes(PITCH_BEND     | ch for ch in range(16))
+        self._cc_status      = bytes(CONTROL_CHANGE | ch for ch in range(16))
+
+        # Static messages, built once per channel and queued by reference
+        self._pb_centre_msg: List[bytes] = [
+            bytes((self._pb_status[ch], 0x00, 0x40)) for ch in range(16)   # 0x40 << 7 = 8192
+        ]
+        self._all_notes_off_msg: List[bytes] = [
+            bytes((self._cc_status[ch], CC_ALL_NOTES_OFF, 0)) for ch in range(16)
+        ]
+
+        # Outgoing queue drained by the sender thread.  deque.append and
+        # popleft are atomic; the event only wakes the sender.
+        self._midi_q: Deque[bytes] = deque()
+        self._midi_evt = threading.Event()
+        self._closing = False
+        self._sender = threading.Thread(target=self._sender_loop, name="mpe-sender", daemon=True)
+        self._sender.start()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -77,12 +105,10 @@ class MPEEngine:
         self.active_notes[finger_id] = (chan, note_num)
 
         # Reset per-note pitch-bend to centre (value 8192)
-        pb_centre_lsb = 0x00
-        pb_centre_msb = 0x40  # 0x40 << 7 = 8192
-        self._send([PITCH_BEND | chan, pb_centre_lsb, pb_centre_msb])
+        self._send(self._pb_centre_msg[chan])
 
         velocity = max(1, min(127, int(velocity)))
-        self._send([NOTE_ON | chan, note_num & 0x7F, velocity])
+        self._send(bytes((self._noteon_status[chan], note_num & 0x7F, velocity)))
 
     def update_expression(
         self,
@@ -105,13 +131,11 @@ class MPEEngine:
 
         # Pitch Bend: split 14-bit value into LSB and MSB
         pb = max(0, min(16383, int(pitch_bend)))
-        pb_lsb = pb & 0x7F
-        pb_msb = (pb >> 7) & 0x7F
-        self._send([PITCH_BEND | chan, pb_lsb, pb_msb])
+        self._send(bytes((self._pb_status[chan], pb & 0x7F, (pb >> 7) & 0x7F)))
 
         # CC 74 – Timbre / Brightness (Y-axis)
         cc_val = max(0, min(127, int(y_val * 127)))
-        self._send([CONTROL_CHANGE | chan, CC_TIMBRE, cc_val])
+        self._send(bytes((self._cc_status[chan], CC_TIMBRE, cc_val)))
 
     def note_off(self, finger_id: object, note_num: int | None = None) -> None:
         """
@@ -127,26 +151,45 @@ class MPEEngine:
         chan, stored_note = self.active_notes.pop(finger_id)
         actual_note = stored_note if note_num is None else note_num
 
-        self._send([NOTE_OFF | chan, actual_note & 0x7F, 0])
+        self._send(bytes((self._noteoff_status[chan], actual_note & 0x7F, 0)))
 
         # Reset pitch-bend to centre before the channel is reused
-        self._send([PITCH_BEND | chan, 0x00, 0x40])
+        self._send(self._pb_centre_msg[chan])
 
         self.available_channels.append(chan)
 
     def all_notes_off(self) -> None:
         """Panic: send CC 123 (All Notes Off) on every MIDI channel."""
-        for channel in range(16):
-            self._send([CONTROL_CHANGE | channel, CC_ALL_NOTES_OFF, 0])
+        for msg in self._all_notes_off_msg:
+            self._send(msg)
         self.active_notes.clear()
         self.available_channels = list(range(1, 16))
 
+    def close(self) -> None:
+        """Flush any queued messages and stop the sender thread."""
+        self._closing = True
+        self._midi_evt.set()
+        self._sender.join(timeout=1.0)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _send(self, message: list) -> None:
-        try:
-            self.midi_out.send_message(message)
-        except Exception as exc:  # pragma: no cover
-            print(f"[MPE] MIDI send error: {exc}")
+    def _send(self, message: bytes) -> None:
+        # Messages are immutable bytes, so they can be queued as-is.
+        self._midi_q.append(message)
+        self._midi_evt.set()
+
+    def _sender_loop(self) -> None:
+        q, evt = self._midi_q, self._midi_evt
+        while True:
+            evt.wait()
+            evt.clear()
+            while q:
+                message = q.popleft()
+                try:
+                    self.midi_out.send_message(message)
+                except Exception as exc:  # pragma: no cover
+                    print(f"[MPE] MIDI send error: {exc}")
+            if self._closing:
+                return
@@ -11,10 +11,27 @@ Reference:
 The filter adapts its cutoff frequency based on the speed of the input:
   - Slow motion  → low cutoff → heavy smoothing (removes jitter)
   - Fast motion  → high cutoff → light smoothing (preserves responsiveness)
+
+Two flavours are provided:
+  - OneEuroFilter   : one object per coordinate axis per tracked point.
+  - one_euro_batch  : Numba-compiled kernel that filters many points at once,
+                      with the filter state held in caller-owned NumPy arrays.
 """
 
 import math
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+TWO_PI = 2.0 * math.pi
+
 
 class OneEuroFilter:
     """
@@ -82,3 +99,57 @@ class OneEuroFilter:
     def _alpha(t_e: float, cutoff: float) -> float:
         r = 2.0 * math.pi * cutoff * t_e
         return r / (r + 1.0)
+
+
+@njit(cache=True, fastmath=True)
+def one_euro_batch(
+    x_new: np.ndarray,
+    t: float,
+    x_prev: np.ndarray,
+    dx_prev: np.ndarray,
+    t_prev: np.ndarray,
+    min_cutoff: float,
+    beta: float,
+    d_cutoff: float,
+) -> np.ndarray:
+    """
+    Filter N independent signals sampled at the same timestamp.
+
+    State is struct-of-arrays and updated in place; allocate it as
+    ``x_prev = zeros(N)``, ``dx_prev = zeros(N)``, ``t_prev = full(N, -1.0)``
+    (a negative ``t_prev`` marks a slot that has not seen a sample yet).
+
+    Args:
+        x_new      : (N,) raw measurements
+        t          : timestamp in seconds shared by all samples
+        x_prev, dx_prev, t_prev : (N,) filter state, modified in place
+        min_cutoff, beta, d_cutoff : as for OneEuroFilter
+
+    Returns:
+        (N,) filtered values.
+    """
+    n = x_new.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        x = x_new[i]
+        if t_prev[i] < 0.0:
+            x_prev[i] = x
+            dx_prev[i] = 0.0
+            t_prev[i] = t
+            out[i] = x
+            continue
+
+        t_e = t - t_prev[i]
+        t_prev[i] = t
+
+        r = TWO_PI * d_cutoff * t_e
+        a_d = r / (r + 1.0)
+        dx_hat = a_d * ((x - x_prev[i]) / t_e) + (1.0 - a_d) * dx_prev[i]
+        dx_prev[i] = dx_hat
+
+        r = TWO_PI * (min_cutoff + beta * abs(dx_hat)) * t_e
+        a = r / (r + 1.0)
+        x_hat = a * x + (1.0 - a) * x_prev[i]
+        x_prev[i] = x_hat
+        out[i] = x_hat
+    return out